@@ -1,3 +1,8 @@
+import copy
+import pickle
+import weakref
+from typing import List, Optional
+
 import pydantic
 import tomlkit
 
@@ -23,6 +28,10 @@ toml_doc = tomlkit.parse(
     "typechecked = false\n"
 )
 
+# the submodule is reachable from the package, and typing helpers don't leak into it
+assert tomlantic.tomlantic.ModelBoundTOML is tomlantic.ModelBoundTOML
+assert not any(hasattr(tomlantic, name) for name in ("TYPE_CHECKING", "Any", "List"))
+
 # 0.1.0: validators
 tomlantic.validate_heterogeneous_collection([1, 2, "3"], (int, str))
 tomlantic.validate_homogeneous_collection([1, 2, 3], int)
@@ -71,6 +80,11 @@ assert diff == tomlantic.Difference(
 # new in 0.2.0: test get_toml_field and set_toml_field
 toml = tomlantic.ModelBoundTOML(File, toml_doc)
 assert tomlantic.get_toml_field(document=toml_doc, location="project.name") == "tomlantic"
+assert tomlantic.get_toml_field(toml_doc, "project.nonexistent", default="?") == "?"
+assert tomlantic.get_toml_field(toml_doc, "project.typechecked", default=False) == False
+empty_table_doc = tomlkit.parse("[project]\n[project.empty]\n")
+empty_table = tomlantic.get_toml_field(empty_table_doc, "project.empty", default={})
+assert empty_table is empty_table_doc["project"]["empty"]  # type: ignore
 tomlantic.set_toml_field(
     document=toml_doc, location="project.name", value="NOT tomlantic"
 )
@@ -101,4 +115,145 @@ toml.load_from_document(incoming_document=incoming_toml_doc, selective=True)
 assert toml.model.project.description.endswith("!")
 assert toml.get_field("project.whuh") == None, "extra fields were not ignored"
 
+# load_from_document only applies changes if all of them validate
+toml = tomlantic.ModelBoundTOML(File, toml_doc)
+try:
+    toml.load_from_document(incoming_document=incoming_toml_doc, selective=False)
+except tomlantic.TOMLValidationError:
+    pass
+else:
+    assert False, "load_from_document should have failed here"
+assert not toml.model.project.description.endswith("!"), "changes were partially applied"
+
+# validation errors are converted into their respective tomlantic errors
+try:
+    tomlantic.ModelBoundTOML(File, tomlkit.parse('[project]\nname = "tomlantic"\n'))
+except tomlantic.TOMLValidationError as err:
+    assert len(err.errors) == 2
+    assert all(isinstance(e, tomlantic.TOMLMissingError) for e in err.errors)
+    assert err.errors[0].loc == ("project", "description")
+    assert err.errors[0].type == "missing"
+else:
+    assert False, "ModelBoundTOML should have failed here"
+
+
+# set_field locations given as lists are reported as tuples
+try:
+    tomlantic.ModelBoundTOML(File, toml_doc).set_field(
+        ["project", "typechecked"], "not a bool"  # type: ignore
+    )
+except tomlantic.TOMLValidationError as err:
+    assert err.errors[0].loc == ("project", "typechecked")
+else:
+    assert False, "ModelBoundTOML.set_field should have failed here"
+
+
+# list indices in error locations are kept as strings
+class Listed(pydantic.BaseModel):
+    values: List[int]
+
+
+try:
+    tomlantic.ModelBoundTOML(Listed, tomlkit.parse('values = [1, "2?"]\n'))
+except tomlantic.TOMLValidationError as err:
+    assert isinstance(err.errors[0], tomlantic.TOMLValueError)
+    assert err.errors[0].loc == ("values", "1")
+    assert err.errors[0].loc_str == "values.1"
+else:
+    assert False, "ModelBoundTOML should have failed here"
+
+
+# unchanged nested models don't add tables to the dumped document
+class Extras(pydantic.BaseModel):
+    enabled: bool = False
+
+
+class FileWithDefaults(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(validate_assignment=True)
+    project: Project
+    extras: Extras = Extras()
+
+
+toml_with_defaults = tomlantic.ModelBoundTOML(FileWithDefaults, toml_doc)
+assert "extras" not in toml_with_defaults.model_dump_toml()
+toml_with_defaults.model.extras.enabled = True
+assert toml_with_defaults.model_dump_toml()["extras"]["enabled"] == True  # type: ignore
+
+# bound models can be weakly referenced, copied and pickled
+assert weakref.ref(toml_with_defaults)() is toml_with_defaults
+for toml_copy in (
+    copy.copy(toml_with_defaults),
+    copy.deepcopy(toml_with_defaults),
+    pickle.loads(pickle.dumps(toml_with_defaults)),
+):
+    assert toml_copy.model == toml_with_defaults.model
+    assert (
+        toml_copy.model_dump_toml().as_string()
+        == toml_with_defaults.model_dump_toml().as_string()
+    )
+
+# trusted documents are constructed without validation
+trusted_toml = tomlantic.ModelBoundTOML(FileWithDefaults, toml_doc, trusted=True)
+assert isinstance(trusted_toml.model.project, Project)
+assert trusted_toml.model.project.name == toml_doc["project"]["name"]  # type: ignore
+assert "extras" not in trusted_toml.model_dump_toml()
+trusted_toml.model.project.name = "tomlantic but trusted"
+assert trusted_toml.model_dump_toml()["project"]["name"] == "tomlantic but trusted"  # type: ignore
+
+
+# extra fields are dumped, compared and loaded like declared fields
+class ExtraSub(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(extra="allow")
+    a: int = 1
+
+
+class ExtraFile(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(extra="allow", validate_assignment=True)
+    sub: ExtraSub
+
+
+extra_doc = tomlkit.parse('foo = "bar"\n[sub]\na = 1\nzz = 2\n')
+extra_toml = tomlantic.ModelBoundTOML(ExtraFile, extra_doc)
+extra_toml.model.foo = "changed"  # type: ignore
+extra_toml.model.sub.a = 2
+assert extra_toml.model_dump_toml()["foo"] == "changed"
+assert extra_toml.difference_between_document(
+    tomlkit.parse("[sub]\na = 2\n")
+).outgoing_changed_fields == ("sub.zz", "foo")
+
+extra_toml = tomlantic.ModelBoundTOML(ExtraFile, extra_doc)
+extra_toml.load_from_document(tomlkit.parse('foo = "new"\n[sub]\na = 1\nzz = 5\n'))
+assert extra_toml.model.foo == "new"  # type: ignore
+assert extra_toml.model.sub.zz == 5  # type: ignore
+
+# models where only extra fields changed are still dumped
+extra_toml = tomlantic.ModelBoundTOML(ExtraFile, extra_doc)
+extra_toml.model.sub.zz = 3  # type: ignore
+assert extra_toml.model_dump_toml()["sub"]["zz"] == 3  # type: ignore
+extra_toml = tomlantic.ModelBoundTOML(ExtraFile, extra_doc)
+extra_toml.model.foo = "changed"  # type: ignore
+assert extra_toml.model_dump_toml()["foo"] == "changed"
+
+
+# trusted models are plain python, equal to validated ones and don't share the document
+class TrustedSub(pydantic.BaseModel):
+    a: int = 0
+
+
+class TrustedFile(pydantic.BaseModel):
+    tags: List[str]
+    optional: Optional[TrustedSub] = None
+    subs: List[TrustedSub] = []
+
+
+trusted_doc = tomlkit.parse('tags = ["a"]\n[optional]\na = 1\n[[subs]]\na = 2\n')
+trusted_bound = tomlantic.ModelBoundTOML(TrustedFile, trusted_doc, trusted=True)
+assert trusted_bound.model == tomlantic.ModelBoundTOML(TrustedFile, trusted_doc).model
+assert trusted_bound.model.optional is not None and trusted_bound.model.optional.a == 1
+assert trusted_bound.model.subs[0].a == 2
+assert type(trusted_bound.model.tags[0]) is str
+trusted_bound.model.tags.append("b")
+assert trusted_doc["tags"] == ["a"]
+assert trusted_bound.model_dump_toml()["tags"] == ["a", "b"]
+
 print("ok!")
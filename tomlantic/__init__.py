@@ -29,20 +29,64 @@ OTHER DEALINGS IN THE SOFTWARE.
 For more information, please refer to <http://unlicense.org/>
 """
 
-from .tomlantic import (
-    Difference,
-    ModelBoundTOML,
-    TomlanticException,
-    TOMLAttributeError,
-    TOMLBaseSingleError,
-    TOMLFrozenError,
-    TOMLMissingError,
-    TOMLValidationError,
-    TOMLValueError,
-    get_toml_field,
-    set_toml_field,
-    validate_heterogeneous_collection,
-    validate_homogeneous_collection,
-    validate_to_multiple_types,
-    validate_to_specific_type,
-)
+import importlib as _importlib
+import typing as _typing
+
+if _typing.TYPE_CHECKING:
+    from .tomlantic import (
+        Difference,
+        ModelBoundTOML,
+        TomlanticException,
+        TOMLAttributeError,
+        TOMLBaseSingleError,
+        TOMLFrozenError,
+        TOMLMissingError,
+        TOMLValidationError,
+        TOMLValueError,
+        get_toml_field,
+        set_toml_field,
+        validate_heterogeneous_collection,
+        validate_homogeneous_collection,
+        validate_to_multiple_types,
+        validate_to_specific_type,
+    )
+
+__all__ = [
+    "Difference",
+    "ModelBoundTOML",
+    "TomlanticException",
+    "TOMLAttributeError",
+    "TOMLBaseSingleError",
+    "TOMLFrozenError",
+    "TOMLMissingError",
+    "TOMLValidationError",
+    "TOMLValueError",
+    "get_toml_field",
+    "set_toml_field",
+    "validate_heterogeneous_collection",
+    "validate_homogeneous_collection",
+    "validate_to_multiple_types",
+    "validate_to_specific_type",
+]
+
+
+def __getattr__(name: str) -> _typing.Any:
+    # importing .tomlantic pulls in pydantic and tomlkit, so defer it until a name is
+    # actually used. importing the submodule also binds it to the package, so
+    # `tomlantic.tomlantic` only resolves here the first time.
+    # (`from . import tomlantic` would recurse into this function looking it up)
+    if (name in __all__) or (name == "tomlantic"):
+        _tomlantic = _importlib.import_module(".tomlantic", __name__)
+
+        if name == "tomlantic":
+            return _tomlantic
+
+        value = getattr(_tomlantic, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> _typing.List[str]:
+    return [*__all__, "tomlantic"]
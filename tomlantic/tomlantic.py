@@ -29,19 +29,29 @@ OTHER DEALINGS IN THE SOFTWARE.
 For more information, please refer to <http://unlicense.org/>
 """
 
+import collections.abc
+import types
 from copy import deepcopy
+from datetime import date, datetime, time
+from functools import lru_cache
 from typing import (
     Any,
     Collection,
+    Dict,
     Generic,
+    Iterator,
     List,
     NamedTuple,
     NoReturn,
     Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
+    get_args,
+    get_origin,
 )
 
 from pydantic import BaseModel, ValidationError
@@ -53,6 +63,35 @@ from tomlkit import table
 T = TypeVar("T")
 Ts = TypeVar("Ts")
 
+# types that can hold fields in a toml document, for isinstance checks.
+# tomlkit's types are abc-based which makes isinstance slow, so checks against these
+# test for an exact type match first
+_TABLE_TYPES = (tomlitems.Table, TOMLDocument)
+
+
+# common concrete collection types, checked by exact type before the slower abc check
+_COLLECTION_TYPES = (list, tuple, set, frozenset, dict)
+
+
+# origins of union annotations, as `X | Y` unions from python 3.10 have their own
+_UNION_ORIGINS = (Union, getattr(types, "UnionType", Union))
+
+
+# sentinel for missing fields, as any value (including a given default) can be a field
+_MISSING: Any = object()
+
+
+@lru_cache(maxsize=1024)
+def _split_location(location: str) -> Tuple[str, ...]:
+    """INTERNAL FUNCTION to split a dotted location, cached as the same paths recur"""
+    return tuple(location.split("."))
+
+
+@lru_cache(maxsize=256)
+def _format_types(t: Tuple[type, ...]) -> str:
+    """INTERNAL FUNCTION to format a tuple of types for error messages"""
+    return "(" + ", ".join([f"'{_t.__name__}'" for _t in t]) + ")"
+
 
 def validate_to_specific_type(v: Any, t: Type[T]) -> T:
     """
@@ -65,7 +104,8 @@ def validate_to_specific_type(v: Any, t: Type[T]) -> T:
         ```
     """
 
-    if not isinstance(v, t):
+    # exact type matches are the common case, and skip walking the mro
+    if type(v) is not t and not isinstance(v, t):
         raise ValueError(
             f"value of type '{v.__class__.__name__}' must be a '{t.__name__}'"
         )
@@ -87,10 +127,10 @@ def validate_to_multiple_types(v: Any, t: Tuple[Type[Ts], ...]) -> Ts:
     returns `v` or raises `ValueError` if `v` is not of type `t`
     """
 
-    if not isinstance(v, t):
+    if type(v) not in t and not isinstance(v, t):
         raise ValueError(
             f"value of type '{v.__class__.__name__}' must be of one of types "
-            "(" + ", ".join([f"'{_t.__name__}'" for _t in t]) + ")"
+            + _format_types(t)
         )
 
     return v
@@ -109,9 +149,16 @@ def validate_homogeneous_collection(v: Any, t: Type[T]) -> Collection[T]:
     returns `v` or raises `ValueError` if any value in `v` is not of type `t`
     """
 
-    if not isinstance(v, Collection):
+    if (type(v) not in _COLLECTION_TYPES) and not isinstance(v, Collection):
         raise ValueError("value must be a collection (list, tuple, set, etc)")
 
+    # fast path: most collections pass, so only index into them when one doesn't
+    for _v in v:
+        if (type(_v) is not t) and not isinstance(_v, t):
+            break
+    else:
+        return v
+
     for idx, _v in enumerate(v, start=1):
         if not isinstance(_v, t):
             raise ValueError(
@@ -136,15 +183,20 @@ def validate_heterogeneous_collection(
         ```
     """
 
-    if not isinstance(v, Collection):
+    if (type(v) not in _COLLECTION_TYPES) and not isinstance(v, Collection):
         raise ValueError("value must be a collection (list, tuple, set, etc)")
 
+    for _v in v:
+        if (type(_v) not in t) and not isinstance(_v, t):
+            break
+    else:
+        return v
+
     for idx, _v in enumerate(v, start=1):
         if not isinstance(_v, t):
             raise ValueError(
                 f"value {idx} ('{_v}') in collection of type '{_v.__class__.__name__}' "
-                f"must one of types "
-                "(" + ", ".join([f"'{_t.__name__}'" for _t in t]) + ")"
+                f"must one of types " + _format_types(t)
             )
 
     return v
@@ -169,13 +221,20 @@ def get_toml_field(
     """
 
     if isinstance(location, str):
-        location = tuple(location.split("."))
+        # flat keys don't need splitting
+        if "." not in location:
+            return document.get(location, default)
+
+        location = _split_location(location)
+
+    if len(location) == 1:
+        return document.get(location[0], default)
 
     field = document
 
     for loc in location:
-        field = field.get(loc, default)
-        if field == default:
+        field = field.get(loc, _MISSING)
+        if field is _MISSING:
             return default
 
     return field
@@ -203,7 +262,7 @@ def set_toml_field(
     """
 
     if isinstance(location, str):
-        location = tuple(location.split("."))
+        location = _split_location(location)
 
     field: Union[tomlitems.Table, TOMLDocument] = document
     current_loc: List[str] = []
@@ -215,13 +274,13 @@ def set_toml_field(
             field[loc] = table()
         target = field[loc]
 
-        if not isinstance(target, (tomlitems.Table, TOMLDocument)):
+        if (type(target) not in _TABLE_TYPES) and not isinstance(target, _TABLE_TYPES):
             raise LookupError(
                 f"attempting to set a field inside a non-table "
                 f"at location '{'.'.join(current_loc)}'"
             )
 
-        field = target
+        field = cast(Union[tomlitems.Table, TOMLDocument], target)
 
     field[location[-1]] = value
 
@@ -238,12 +297,16 @@ class TOMLBaseSingleError(TomlanticException):
 
     attributes:
       - loc:            `tuple[str]`
+      - loc_str:        `str`
       - msg:            `str`
+      - type:           `str`
       - pydantic_error: `pydantic_core.ErrorDetails`
     """
 
     loc: Tuple[str, ...]
+    loc_str: str
     msg: str = ""
+    type: str
     pydantic_error: ErrorDetails
 
     def __init__(
@@ -253,6 +316,8 @@ class TOMLBaseSingleError(TomlanticException):
         pydantic_error: ErrorDetails,
     ) -> None:
         self.loc = loc
+        self.loc_str = ".".join(loc)
+        self.type = pydantic_error["type"]
         self.pydantic_error = pydantic_error
         super().__init__(*args)
         self.msg = str(self)
@@ -291,16 +356,25 @@ class TOMLValidationError(TomlanticException):
     raised when instantiating ModelBoundTOML
     """
 
-    errors: Tuple[TOMLBaseSingleError, ...]
+    _errors: Sequence[TOMLBaseSingleError]
+    _errors_tuple: Optional[Tuple[TOMLBaseSingleError, ...]]
 
     def __init__(
         self,
         *args,
-        errors: Tuple[TOMLBaseSingleError, ...],
+        errors: Sequence[TOMLBaseSingleError],
     ) -> None:
-        self.errors = errors
+        self._errors = errors
+        self._errors_tuple = None
         super().__init__(*args)
 
+    @property
+    def errors(self) -> Tuple[TOMLBaseSingleError, ...]:
+        """the errors that occurred, as a tuple built on first access"""
+        if self._errors_tuple is None:
+            self._errors_tuple = tuple(self._errors)
+        return self._errors_tuple
+
 
 class Difference(NamedTuple):
     """
@@ -316,6 +390,45 @@ class Difference(NamedTuple):
     outgoing_changed_fields: Tuple[str, ...]
 
 
+class _IncomingChange(NamedTuple):
+    """
+    INTERNAL CLASS
+
+    a field that differs between an outgoing tomlantic.ModelBoundTOML and an incoming
+    tomlkit.TOMLDocument, along with the values on both sides
+    """
+
+    location: Tuple[str, ...]
+    outgoing_value: Any
+    incoming_value: Any
+
+
+# pydantic error types mapped to the tomlantic error raised for them and the message
+# used if pydantic did not provide one. unlisted types become a TOMLValueError
+_ERROR_TYPES: Dict[str, Tuple[Type[TOMLBaseSingleError], str]] = {
+    "missing": (
+        TOMLMissingError,
+        "the required field is missing from the document",
+    ),
+    "frozen_field": (
+        TOMLFrozenError,
+        "attempting to override a field that is frozen or an instance that is frozen",
+    ),
+    "frozen_instance": (
+        TOMLFrozenError,
+        "attempting to override a field that is frozen or an instance that is frozen",
+    ),
+    "no_such_attribute": (
+        TOMLAttributeError,
+        "the field does not exist or is an extra field not in the model",
+    ),
+    "extra_forbidden": (
+        TOMLAttributeError,
+        "the field does not exist or is an extra field not in the model",
+    ),
+}
+
+
 def handle_validation_error(
     e: ValidationError,
     location_override: Optional[Tuple[str, ...]] = None,
@@ -326,86 +439,51 @@ def handle_validation_error(
     location_overrides is only to be used for `ModelBoundTOML.set_field`
     """
     errors: List[TOMLBaseSingleError] = []
-    error_messages: List[str] = []
+    # errors often share locations (e.g. many bad values in one table), so equal
+    # location tuples are collapsed into one shared tuple
+    seen_locs: Dict[Tuple[Union[str, int], ...], Tuple[str, ...]] = {}
 
-    for pydantic_error in e.errors():
-        loc: Tuple[str, ...] = ("unknown",)
-
-        try:
-            loc = (
-                tuple(validate_homogeneous_collection(pydantic_error["loc"], str))
-                if (location_override is None)
-                else location_override
-            )
+    # overrides may be any sequence (e.g. a list), but are used as dictionary keys
+    if location_override is not None:
+        location_override = tuple(location_override)
 
-        except Exception:
-            pass
+    for pydantic_error in e.errors():
+        error_type = pydantic_error["type"]
 
-        if pydantic_error["type"] is None:
+        if error_type is None:
             continue
 
-        elif pydantic_error["type"] == "missing":
-            errors.append(
-                TOMLMissingError(
-                    str(
-                        pydantic_error.get(
-                            "msg",
-                            "the required field is missing from the document",
-                        )
-                    ),
-                    loc=loc,
-                    pydantic_error=pydantic_error,
-                )
-            )
+        # pydantic locations are tuples of field names, only with integers for list
+        # indices, which are converted to strings. each distinct location is only
+        # checked once, and equal locations share one tuple
+        raw_loc = (
+            pydantic_error["loc"] if (location_override is None) else location_override
+        )
+        loc = seen_locs.get(raw_loc)
 
-        elif pydantic_error["type"] in ("frozen_field", "frozen_instance"):
-            errors.append(
-                TOMLFrozenError(
-                    str(
-                        pydantic_error.get(
-                            "msg",
-                            "attempting to override a field that is frozen or an instance that is frozen",
-                        )
-                    ),
-                    loc=loc,
-                    pydantic_error=pydantic_error,
-                )
-            )
+        if loc is None:
+            loc = cast(Tuple[str, ...], raw_loc)
 
-        elif pydantic_error["type"] in ("no_such_attribute", "extra_forbidden"):
-            errors.append(
-                TOMLAttributeError(
-                    str(
-                        pydantic_error.get(
-                            "msg",
-                            "the field does not exist or is an extra field not in the model",
-                        )
-                    ),
-                    loc=loc,
-                    pydantic_error=pydantic_error,
-                )
-            )
+            if not all(type(part) is str for part in loc):
+                loc = tuple(map(str, loc))
 
-        else:
-            errors.append(
-                TOMLValueError(
-                    str(pydantic_error.get("msg", "unknown value error")),
-                    loc=loc,
-                    pydantic_error=pydantic_error,
-                )
-            )
+            seen_locs[raw_loc] = loc
 
-    for tomalntic_error in errors:
-        error_messages.append(
-            f'Field "{".".join(tomalntic_error.loc)}": {str(tomalntic_error)} '
-            f'({tomalntic_error.pydantic_error["type"]})'
+        error_class, default_msg = _ERROR_TYPES.get(
+            error_type, (TOMLValueError, "unknown value error")
         )
+        msg = str(pydantic_error.get("msg", default_msg))
+
+        tomlantic_error = error_class(msg, loc=loc, pydantic_error=pydantic_error)
+        errors.append(tomlantic_error)
 
     raise TOMLValidationError(
         f"{len(errors)} {'error' if len(errors) == 1 else 'errors'} "
         "occurred while validating the TOML document:\n"
-        + "\n".join([f"  {e}" for e in error_messages]),
-        errors=tuple(errors),
+        + "\n".join(
+            f'  Field "{error.loc_str}": {error.msg} ({error.type})' for error in errors
+        ),
+        errors=errors,
     )
 
 
@@ -432,7 +510,11 @@ def _get_model_field(
     """
 
     if isinstance(location, str):
-        location = tuple(location.split("."))
+        # flat keys don't need splitting
+        if "." not in location:
+            return getattr(model, location, default)
+
+        location = _split_location(location)
 
     field = model
 
@@ -445,6 +527,194 @@ def _get_model_field(
         return default
 
 
+def _set_model_field(
+    model: M,
+    location: Union[str, Tuple[str, ...]],
+    value: Any,
+    handle_errors: bool = True,
+) -> None:
+    """
+    INTERNAL FUNCTION
+
+    sets a field by it's location, see `ModelBoundTOML.set_field`
+
+    arguments:
+        - model: `M`
+        - location: `str | tuple[str, ...]`
+        - value: `Any`
+        - handle_errors: `bool` = True
+    """
+
+    if isinstance(location, str):
+        location = _split_location(location)
+
+    field = model
+
+    for loc in location[:-1]:
+        field = getattr(field, loc)
+
+    try:
+        setattr(field, location[-1], value)
+
+    except ValidationError as err:
+        if not handle_errors:
+            raise err
+
+        handle_validation_error(e=err, location_override=location)
+
+
+def _model_values(model: BaseModel) -> Dict[str, Any]:
+    """
+    INTERNAL FUNCTION
+
+    returns a model's field values, including extra fields. pydantic keeps declared
+    fields in the instance __dict__ and extra fields (from `extra="allow"`) in
+    __pydantic_extra__, so the __dict__ is returned as-is when there are no extras.
+    some pydantic versions (e.g. 2.0) write assigned extras to the __dict__ and leave
+    the stale value in __pydantic_extra__, so values in the __dict__ win
+    """
+
+    extra = model.__pydantic_extra__
+
+    if not extra:
+        return model.__dict__
+
+    values = model.__dict__
+    return {**values, **{key: value for key, value in extra.items() if key not in values}}
+
+
+def _flatten_model(
+    model: BaseModel,
+    prefix: Tuple[str, ...] = (),
+) -> Dict[Tuple[str, ...], Any]:
+    """
+    INTERNAL FUNCTION
+
+    flattens a model into a dictionary of field locations to field values, including
+    the locations of nested models themselves, so fields can be looked up without
+    walking the model each time
+    """
+
+    fields: Dict[Tuple[str, ...], Any] = {}
+
+    for key, value in _model_values(model).items():
+        location = prefix + (key,)
+        fields[location] = value
+
+        if isinstance(value, BaseModel):
+            fields.update(_flatten_model(value, location))
+
+    return fields
+
+
+def _unwrap_toml(value: Any) -> Any:
+    """
+    INTERNAL FUNCTION to convert tomlkit items into new plain python values, so that
+    models constructed from a document never share objects with it
+    """
+
+    if hasattr(value, "unwrap"):
+        return value.unwrap()
+
+    # tomlkit versions before 0.11 have no unwrap
+    if isinstance(value, dict):
+        return {str(key): _unwrap_toml(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [_unwrap_toml(item) for item in value]
+
+    if not isinstance(value, tomlitems.Item):
+        return deepcopy(value)
+
+    # other scalar items subclass their builtin types, so convert them back to those
+    if isinstance(value, tomlitems.Bool):
+        return value.value
+
+    if isinstance(value, tomlitems.String):
+        return str(value)
+
+    if isinstance(value, tomlitems.Integer):
+        return int(value)
+
+    if isinstance(value, tomlitems.Float):
+        return float(value)
+
+    if isinstance(value, tomlitems.DateTime):
+        return datetime(
+            value.year,
+            value.month,
+            value.day,
+            value.hour,
+            value.minute,
+            value.second,
+            value.microsecond,
+            value.tzinfo,
+        )
+
+    if isinstance(value, tomlitems.Date):
+        return date(value.year, value.month, value.day)
+
+    if isinstance(value, tomlitems.Time):
+        return time(
+            value.hour, value.minute, value.second, value.microsecond, value.tzinfo
+        )
+
+    return deepcopy(value)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    """
+    INTERNAL FUNCTION to build the models in a trusted value, for fields annotated as a
+    model, an optional model, or a list or dict of models. anything else is returned
+    as-is
+    """
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is None:
+        if (
+            isinstance(value, dict)
+            and isinstance(annotation, type)
+            and issubclass(annotation, BaseModel)
+        ):
+            return _construct_model(annotation, value)
+
+    elif origin in _UNION_ORIGINS:
+        models = [
+            arg for arg in args if isinstance(arg, type) and issubclass(arg, BaseModel)
+        ]
+
+        # only build unambiguous unions, e.g. Optional[Model]
+        if isinstance(value, dict) and len(models) == 1:
+            return _construct_model(models[0], value)
+
+    elif origin in (list, collections.abc.Sequence) and isinstance(value, list) and args:
+        return [_construct_value(args[0], item) for item in value]
+
+    elif origin in (dict, collections.abc.Mapping) and isinstance(value, dict) and args:
+        return {key: _construct_value(args[1], item) for key, item in value.items()}
+
+    return value
+
+
+def _construct_model(model: Type[M], data: Dict[str, Any]) -> M:
+    """
+    INTERNAL FUNCTION to build a model from trusted, unwrapped data without validating
+    it. see _construct_value for which nested models are built
+    """
+
+    values = dict(data)
+
+    for name, field in model.model_fields.items():
+        key = field.alias or name
+
+        if key in values:
+            values[key] = _construct_value(field.annotation, values[key])
+
+    return model.model_construct(**values)
+
+
 class ModelBoundTOML(Generic[M]):
     """
     glue class for pydantic models and tomlkit documents
@@ -472,8 +742,17 @@ class ModelBoundTOML(Generic[M]):
         ```
     """
 
+    __slots__ = (
+        "model",
+        "__original_model",
+        "__original_fields",
+        "__document",
+        "__weakref__",
+    )
+
     model: M
     __original_model: M
+    __original_fields: Dict[Tuple[str, ...], Any]
     __document: TOMLDocument
 
     def __repr__(self) -> str:
@@ -484,33 +763,45 @@ class ModelBoundTOML(Generic[M]):
         model: Type[M],
         document: TOMLDocument,
         handle_errors: bool = True,
+        trusted: bool = False,
     ) -> None:
         """instantiates the class with a `BaseModel` and a `TOMLDocument`
 
         will handle `pydantic.ValidationError` into more toml-friendly error messages.
         set `handle_errors` to `False` to raise the original `pydantic.ValidationError`
 
+        set `trusted` to `True` to skip validation entirely and construct the model
+        as-is with `BaseModel.model_construct`. values are not checked nor converted,
+        so only use this on documents that are known to be valid, never on user input.
+        nested models are only built for fields annotated as a model, an optional
+        model, or a list or dict of models. other fields get plain python values
+
         arguments:
           - model:         `pydantic.BaseModel`
           - document:      `tomlkit.TOMLDocument`
           - handle_errors: `bool` = False
+          - trusted:       `bool` = False
 
         raises:
           - `tomlantic.TOMLValidationError` if the document does not validate with the model
           - `pydantic.ValidationError`      if the document does not validate with the model and `handle_errors` is `False`
         """
-        try:
-            self.model = model.model_validate(document)
+        if trusted:
+            self.model = _construct_model(model, _unwrap_toml(document))
+
+        else:
+            try:
+                self.model = model.model_validate(document)
 
-        except ValidationError as err:
-            if not handle_errors:
-                raise err
+            except ValidationError as err:
+                if not handle_errors:
+                    raise err
 
-            handle_validation_error(err)
+                handle_validation_error(err)
 
-        self.__original_model = model.model_validate(
-            document
-        )  # if we pass the first validation, this should pass too
+        # the document already validated, so copy the result instead of validating again
+        self.__original_model = self.model.model_copy(deep=True)
+        self.__original_fields = _flatten_model(self.__original_model)
         self.__document = document
 
     def model_dump_toml(self) -> TOMLDocument:
@@ -518,40 +809,75 @@ class ModelBoundTOML(Generic[M]):
         document = deepcopy(self.__document)
 
         # add values that were changed from when the model was instantiated
-        def apply_model_differences(
-            original_model: BaseModel,
-            current_model: BaseModel,
-            toml: Union[TOMLDocument, tomlitems.Table],
-        ) -> None:
-            for original_kv, current_kv in zip(original_model, current_model):
-                og_key, og_val = original_kv
-                cu_key, cu_val = current_kv
-
-                assert (
-                    og_key == cu_key
-                ), f"old model and new model has different keys: '{og_key}'/'{cu_key}' (unreachable?)"
+        # field values are iterated directly with _model_values instead of going through
+        # BaseModel.__iter__
+        # each stack entry is a model being walked: the original model's values, the
+        # current model's fields left to apply, and the table they are written to.
+        # a nested model is walked before the rest of its parent's fields, so fields are
+        # written in the same order as a recursive walk would
+        stack: List[
+            Tuple[
+                Dict[str, Any],
+                Iterator[Tuple[str, Any]],
+                Union[TOMLDocument, tomlitems.Table],
+            ]
+        ] = []
+
+        # nothing under a model changed, so there's nothing to walk through
+        original_values = _model_values(self.__original_model)
+        current_values = _model_values(self.model)
+
+        if original_values != current_values:
+            stack.append((original_values, iter(current_values.items()), document))
+
+        while len(stack) > 0:
+            original_values, current_fields, toml = stack[-1]
+
+            for key, cu_val in current_fields:
+                # extra fields may have been added since instantiation
+                og_val = original_values.get(key, _MISSING)
+
+                if og_val is cu_val:
+                    continue
 
                 if isinstance(cu_val, BaseModel):
                     assert isinstance(
                         og_val, BaseModel
-                    ), f"key '{og_key}'/'{cu_key}' old model and new model arent basemodels (unreachable?)"
+                    ), f"key '{key}' old model and new model arent basemodels (unreachable?)"
 
-                    # check if table exists
-                    if cu_key not in toml:
-                        toml[cu_key] = table()
+                    # nothing under this model changed, so leave its table alone
+                    og_values = _model_values(og_val)
+                    cu_values = _model_values(cu_val)
 
-                    toml_cu_key = toml[cu_key]
-                    assert isinstance(
-                        toml_cu_key, (TOMLDocument, tomlitems.Table)
-                    ), f"key {cu_key}: attempting to recurse into an non-table/document"
+                    if og_values == cu_values:
+                        continue
+
+                    # get the table, creating it if it doesn't exist
+                    toml_cu_key = toml.get(key)
+                    if toml_cu_key is None:
+                        toml_cu_key = table()
+                        toml[key] = toml_cu_key
+
+                    assert (type(toml_cu_key) in _TABLE_TYPES) or isinstance(
+                        toml_cu_key, _TABLE_TYPES
+                    ), f"key {key}: attempting to recurse into an non-table/document"
+
+                    stack.append(
+                        (
+                            og_values,
+                            iter(cu_values.items()),
+                            cast(Union[tomlitems.Table, TOMLDocument], toml_cu_key),
+                        )
+                    )
+                    break
 
-                    apply_model_differences(og_val, cu_val, toml_cu_key)
+                elif og_val != cu_val:
+                    toml[key] = cu_val
 
-                elif original_kv != current_kv:
-                    cu_key, cu_val = current_kv
-                    toml[cu_key] = cu_val
+            else:
+                # all fields of this model were applied
+                stack.pop()
 
-        apply_model_differences(self.__original_model, self.model, document)
         return document
 
     def set_field(
@@ -578,22 +904,12 @@ class ModelBoundTOML(Generic[M]):
           - `pydantic.ValidationError`      if the document does not validate with the model and `handle_errors` is `False`
         """
 
-        if isinstance(location, str):
-            location = tuple(location.split("."))
-
-        field = self.model
-
-        for loc in location[:-1]:
-            field = getattr(field, loc)
-
-        try:
-            setattr(field, location[-1], value)
-
-        except ValidationError as err:
-            if not handle_errors:
-                raise err
-
-            handle_validation_error(e=err, location_override=location)
+        _set_model_field(
+            model=self.model,
+            location=location,
+            value=value,
+            handle_errors=handle_errors,
+        )
 
     def get_field(
         self,
@@ -613,88 +929,119 @@ class ModelBoundTOML(Generic[M]):
 
         return _get_model_field(model=self.model, location=location, default=default)
 
-    def difference_between_document(self, incoming_document: TOMLDocument) -> Difference:
+    def __find_differences(
+        self,
+        incoming_document: TOMLDocument,
+    ) -> Tuple[List[_IncomingChange], List[Tuple[str, ...]]]:
         """
-        returns a tomlantic.Difference object of the incoming and outgoing fields that
-        were changed between the model and the comparison_document
-
-        arguments:
-          - incoming_document: `tomlkit.TOMLDocument`
+        INTERNAL METHOD
 
-        returns a tomlantic.Difference namedtuple object
+        walks the model and an incoming document once, returning the incoming changes
+        (with the values on both sides, so callers don't have to look them up again) and
+        the locations of outgoing changes
         """
 
-        incoming_changed_fields: List[str] = []
-        outgoing_changed_fields: List[str] = []
+        incoming_changes: List[_IncomingChange] = []
+        outgoing_changes: List[Tuple[str, ...]] = []
+
+        # go through self.model (outgoing) and compare with incoming_document,
+        # descending into a field when its value is a BaseModel
+        # each stack entry is a model being walked: its location, its table in the
+        # incoming document (only ever read from), and its fields left to compare.
+        # a nested model is walked before the rest of its parent's fields, so fields are
+        # reported in the same order as a recursive walk would
+        stack: List[
+            Tuple[
+                Tuple[str, ...],
+                Union[TOMLDocument, tomlitems.Table],
+                Iterator[Tuple[str, Any]],
+            ]
+        ] = [((), incoming_document, iter(_model_values(self.model).items()))]
+
+        while len(stack) > 0:
+            location, incoming_table, outgoing_fields = stack[-1]
+
+            for outgoing_key, outgoing_value in outgoing_fields:
+                field_location = location + (outgoing_key,)
 
-        def find_differences(
-            location: str,
-            outgoing_model: BaseModel,
-            _incoming_document: Union[TOMLDocument, tomlitems.Table],
-        ) -> None:
-            # go through self.model (outgoing) and compare with incoming_document
-            # recurse if the value is a BaseModel when iterating through the model
-
-            incoming_document = deepcopy(_incoming_document)
-
-            for outgoing_key, outgoing_value in outgoing_model:
                 if isinstance(outgoing_value, BaseModel):
                     if (
                         # check if table exists
                         # if it doesn't, it is a difference
                         outgoing_key
-                        not in incoming_document
+                        not in incoming_table
                     ):
                         # if the incoming toml field doesnt exist, then it is the model
                         # that was changed
-                        outgoing_changed_fields.append(f"{location}.{outgoing_key}")
+                        outgoing_changes.append(field_location)
                         continue
 
-                    incoming_value = incoming_document[outgoing_key]
+                    incoming_value = incoming_table[outgoing_key]
 
-                    if not isinstance(incoming_value, (TOMLDocument, tomlitems.Table)):
+                    if (type(incoming_value) not in _TABLE_TYPES) and not isinstance(
+                        incoming_value, _TABLE_TYPES
+                    ):
                         # if the model is a BaseModel but the document is not a table,
                         # the difference is incoming because we assume the model is the
                         # source of truth
                         # as such if the incoming toml field isnt a table, then it was
                         # changed
-                        incoming_changed_fields.append(f"{location}.{outgoing_key}")
+                        incoming_changes.append(
+                            _IncomingChange(
+                                field_location, outgoing_value, incoming_value
+                            )
+                        )
                         continue
 
-                    find_differences(
-                        location=f"{location}.{outgoing_key}",
-                        outgoing_model=outgoing_value,
-                        _incoming_document=incoming_value,
+                    stack.append(
+                        (
+                            field_location,
+                            cast(Union[tomlitems.Table, TOMLDocument], incoming_value),
+                            iter(_model_values(outgoing_value).items()),
+                        )
                     )
-
-                    continue
+                    break
 
                 # if the field is not a BaseModel, then we can compare the field directly
-                if outgoing_key not in incoming_document:
+                if outgoing_key not in incoming_table:
                     # if the incoming toml field doesnt exist, then it is the model
                     # that was changed
-                    outgoing_changed_fields.append(f"{location}.{outgoing_key}")
+                    outgoing_changes.append(field_location)
 
                 else:
-                    incoming_value = incoming_document[outgoing_key]
+                    incoming_value = incoming_table[outgoing_key]
 
                     if outgoing_value != incoming_value:
-                        incoming_changed_fields.append(f"{location}.{outgoing_key}")
-                        # outgoing_changed_fields.append(f"{location}.{outgoing_key}")
+                        incoming_changes.append(
+                            _IncomingChange(
+                                field_location, outgoing_value, incoming_value
+                            )
+                        )
 
-        find_differences(
-            location="",
-            outgoing_model=self.model,
-            _incoming_document=incoming_document,
-        )
+            else:
+                # all fields of this model were compared
+                stack.pop()
+
+        return incoming_changes, outgoing_changes
+
+    def difference_between_document(self, incoming_document: TOMLDocument) -> Difference:
+        """
+        returns a tomlantic.Difference object of the incoming and outgoing fields that
+        were changed between the model and the comparison_document
+
+        arguments:
+          - incoming_document: `tomlkit.TOMLDocument`
+
+        returns a tomlantic.Difference namedtuple object
+        """
+
+        incoming_changes, outgoing_changes = self.__find_differences(incoming_document)
 
         return Difference(
             incoming_changed_fields=tuple(
-                [f.strip(".") for f in incoming_changed_fields]
-            ),
-            outgoing_changed_fields=tuple(
-                [f.strip(".") for f in outgoing_changed_fields]
+                ".".join(change.location) for change in incoming_changes
             ),
+            outgoing_changed_fields=tuple(".".join(loc) for loc in outgoing_changes),
         )
 
     def load_from_document(
@@ -717,32 +1064,33 @@ class ModelBoundTOML(Generic[M]):
 
         no changes are applied until the incoming document passes all model validations
         """
-        differences = self.difference_between_document(incoming_document)
-
-        # new model so no changes are applied until the new model passes all validations
-        new_model = deepcopy(self)
-
-        for incoming_change_location in differences.incoming_changed_fields:
-            if selective and any(
-                [
-                    incoming_change_location in differences.outgoing_changed_fields,
-                    # compare for field changes made since class instantiation
-                    self.get_field(incoming_change_location)
-                    != _get_model_field(
-                        model=self.__original_model, location=incoming_change_location
-                    ),
-                ]
+        incoming_changes, outgoing_changes = self.__find_differences(incoming_document)
+        outgoing_changed_locations = set(outgoing_changes)
+
+        # changes are staged first and then applied to a copy of the model, so no
+        # changes are applied until the new model passes all validations
+        staged_changes: List[Tuple[Tuple[str, ...], Any]] = []
+
+        for incoming_change in incoming_changes:
+            if selective and (
+                incoming_change.location in outgoing_changed_locations
+                # compare for field changes made since class instantiation
+                or incoming_change.outgoing_value
+                != self.__original_fields.get(incoming_change.location)
             ):
                 continue
 
-            if self.get_field(incoming_change_location) is not None:
-                incoming_change_value = get_toml_field(
-                    document=incoming_document,
-                    location=incoming_change_location,
-                )
-                new_model.set_field(
-                    location=incoming_change_location,
-                    value=incoming_change_value,
+            if incoming_change.outgoing_value is not None:
+                staged_changes.append(
+                    (incoming_change.location, incoming_change.incoming_value)
                 )
 
-        self.model = new_model.model
+        if len(staged_changes) == 0:
+            return
+
+        new_model = self.model.model_copy(deep=True)
+
+        for location, value in staged_changes:
+            _set_model_field(model=new_model, location=location, value=value)
+
+        self.model = new_model
@@ -1,16 +1,24 @@
 # script for workflows to use the lowest versions of targeted main dependencies
 # usually to be run with 'poetry lock && poetry install && python test.py' afterwards
 
+import re
 from os import system
 from pathlib import Path
 from sys import stderr
 
+# lines with a '>=' version constraint that end with a '# target' comment
+TARGET_LINE = re.compile(r"^[^\n]*>=[^\n]*# target[ \t]*$", re.MULTILINE)
+
+
+def pin_line(match: "re.Match[str]") -> str:
+    line = match.group(0)
+    replacing_line = line.replace(">=", "==")
+    stderr.write(f"{line}\n")
+    stderr.write(f"-> {replacing_line}\n")
+    return replacing_line
+
+
 pyproj = Path(__file__).parent.joinpath("pyproject.toml").read_text("utf-8")
-for line in pyproj.splitlines():
-    if (">=" in line) and line.strip().endswith("# target"):
-        replacing_line = line.replace(">=", "==")
-        stderr.write(f"{line}\n")
-        stderr.write(f"-> {replacing_line}\n")
-        pyproj = pyproj.replace(line, replacing_line)
+pyproj = TARGET_LINE.sub(pin_line, pyproj)
 
 Path(__file__).parent.joinpath("pyproject.toml").write_text(pyproj, "utf-8")